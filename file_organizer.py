@@ -1,10 +1,17 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import errno
 import json
+import os
+import queue
 import shutil
-from typing import Dict, List
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TypeVar
 
 
 # ---------- Config & data ----------
@@ -14,11 +21,60 @@ class OrganizerConfig:
     extension_index: Dict[str, str]
     ignore_hidden_files: bool = True
     ignore_hidden_folders: bool = True
+    # (suffix, category) pairs for suffixes spanning several dots ('.tar.gz'),
+    # longest first; only scanned for names with more than one dot
+    _multi_dot_suffixes: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    has_multi_dot_suffixes: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._multi_dot_suffixes = tuple(sorted(
+            ((suffix, category) for suffix, category in self.extension_index.items()
+             if suffix.count(".") > 1),
+            key=lambda kv: -len(kv[0]),
+        ))
+        self.has_multi_dot_suffixes = bool(self._multi_dot_suffixes)
+
+    def classify(self, name: str) -> Optional[str]:
+        """
+        Return the category for a file name, or None if it is unmapped.
+        The longest matching suffix wins, so '.tar.gz' beats '.gz'.
+        """
+        return self.classify_suffix(name)[0]
+
+    def classify_suffix(self, name: str) -> Tuple[Optional[str], int]:
+        """
+        Like classify, but also return the length of the matched suffix
+        (0 when unmapped), so renames can keep the whole suffix intact.
+        """
+        head, _, tail = name.rpartition(".")
+        if not head:
+            return None, 0
+
+        if self._multi_dot_suffixes and "." in head:
+            lowered = name.lower()
+            for suffix, category in self._multi_dot_suffixes:
+                # A name that is only the suffix ('.tar.gz') has no extension
+                if lowered.endswith(suffix) and len(lowered) > len(suffix):
+                    return category, len(suffix)
+
+        category = self.extension_index.get("." + tail.lower())
+        return category, (len(tail) + 1 if category else 0)
 
     @classmethod
     def from_json(cls, path: Path) -> "OrganizerConfig":
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
+        """
+        Load a config file. Results are cached per file and reused until
+        its modification time changes.
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
+
+        key = path.resolve()
+        hit = _CONFIG_CACHE.get(key)
+        if hit is not None and hit[0] == mtime_ns:
+            return hit[1]
 
         with path.open("r", encoding="utf-8") as f:
             raw = json.load(f)
@@ -28,14 +84,20 @@ class OrganizerConfig:
 
         ext_index: Dict[str, str] = {}
         for category, exts in categories.items():
+            category = sys.intern(category)
             for ext in exts:
                 ext_index[ext.lower()] = category
 
-        return cls(
+        config = cls(
             extension_index=ext_index,
             ignore_hidden_files=options.get("ignore_hidden_files", True),
             ignore_hidden_folders=options.get("ignore_hidden_folders", True),
         )
+        _CONFIG_CACHE[key] = (mtime_ns, config)
+        return config
+
+
+_CONFIG_CACHE: Dict[Path, Tuple[int, OrganizerConfig]] = {}
 
 
 @dataclass
@@ -47,8 +109,177 @@ class OrganizeResult:
 
 # ---------- Helpers ----------
 
-def _is_hidden(path: Path) -> bool:
-    return path.name.startswith(".")
+_LOG_BATCH_SIZE = 256
+_SCAN_PAGE_SIZE = 1000
+MANIFEST_NAME = ".organizer_cache.json"
+
+
+def _flush_log(buf: List[str]) -> None:
+    if buf:
+        sys.stdout.write("\n".join(buf) + "\n")
+        buf.clear()
+
+
+def _log(buf: List[str], line: str) -> None:
+    """
+    Queue a verbose line and write the queue out in one call every
+    _LOG_BATCH_SIZE lines instead of printing each line separately.
+    """
+    buf.append(line)
+    if len(buf) >= _LOG_BATCH_SIZE:
+        _flush_log(buf)
+
+
+def _is_hidden(name: str) -> bool:
+    return name[0] == "."
+
+
+def _iter_dirs(
+    root: str,
+    recursive: bool,
+    skip_hidden_dirs: bool = False,
+    manifest: Optional[Dict[str, list]] = None,
+) -> Iterator[Tuple[str, int, Optional[List[Tuple[str, str]]], Optional[List[str]], int]]:
+    """
+    Walk 'root' with os.scandir and yield (folder, mtime_ns, files, subfolders,
+    unreadable) pages; unreadable counts symlinks on the page whose target
+    could not be checked (loops, no permission), which are left out. files holds (name, path) for up to _SCAN_PAGE_SIZE non-directory
+    entries. A large folder is yielded as several consecutive pages while it
+    is still being listed; only its last page carries the subfolders list,
+    the others have subfolders=None. Works on plain strings; no Path
+    objects are built.
+    With skip_hidden_dirs, hidden folders are pruned without being listed.
+
+    If a manifest is given, a folder whose mtime still matches its entry is
+    not listed again: it is yielded with files=None and the subfolders
+    recorded in the manifest. mtime_ns is only filled in when a manifest is used.
+    """
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        mtime_ns = 0
+        try:
+            if manifest is not None:
+                mtime_ns = os.stat(current).st_mtime_ns
+                cached = manifest.get(current)
+                if cached is not None and cached[0] == mtime_ns:
+                    pending.extend(os.path.join(current, name) for name in cached[3])
+                    yield current, mtime_ns, None, cached[3], 0
+                    continue
+
+            it = os.scandir(current)
+        except (PermissionError, FileNotFoundError):
+            # Unreadable or vanished subfolders are skipped; the root itself must be readable
+            if current == root:
+                raise
+            continue
+
+        files: List[Tuple[str, str]] = []
+        subdirs: List[str] = []
+        unreadable = 0
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not (skip_hidden_dirs and _is_hidden(entry.name)):
+                        subdirs.append(entry.name)
+                        pending.append(entry.path)
+                    continue
+                # Links to folders are left alone; is_dir() only stats for symlinks
+                if entry.is_symlink():
+                    try:
+                        if entry.is_dir():
+                            continue
+                    except OSError:
+                        unreadable += 1
+                        continue
+                files.append((entry.name, entry.path))
+                if len(files) >= _SCAN_PAGE_SIZE:
+                    yield current, mtime_ns, files, None, unreadable
+                    files = []
+                    unreadable = 0
+
+        yield current, mtime_ns, files, subdirs, unreadable
+
+
+_T = TypeVar("_T")
+
+
+def _prefetch(iterator: Iterator[_T], depth: int = 2) -> Iterator[_T]:
+    """
+    Run 'iterator' on a background thread and keep up to 'depth' items
+    ready, so slow directory reads (network shares, cloud mounts) overlap
+    with the work done on each page. Exceptions are re-raised here.
+    If the consumer stops early, the background thread stops as well.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if not put((True, item)):
+                    return
+        except Exception as exc:
+            put((False, exc))
+        else:
+            put((False, None))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            ok, value = q.get()
+            if not ok:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop.set()
+
+
+# Manifest entries: folder path -> [mtime_ns, unmapped, other skipped, subfolders]
+
+def _manifest_fingerprint(config: OrganizerConfig, recursive: bool) -> str:
+    return json.dumps([
+        sorted(config.extension_index.items()),
+        config.ignore_hidden_files,
+        config.ignore_hidden_folders,
+        recursive,
+    ])
+
+
+def _load_manifest(root: str, fingerprint: str) -> Dict[str, list]:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+        return {}
+    return raw.get("folders", {})
+
+
+def _save_manifest(root: str, fingerprint: str, folders: Dict[str, list]) -> None:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "folders": folders}, f)
+    except OSError:
+        pass
 
 
 def generate_unique_path(target: Path) -> Path:
@@ -70,6 +301,228 @@ def generate_unique_path(target: Path) -> Path:
         counter += 1
 
 
+def _unique_name(name: str, taken: Set[str], suffix_len: int) -> str:
+    """
+    In-memory version of generate_unique_path: pick 'name' or 'name (N).ext'
+    so it is not in 'taken' (lower-cased names), and reserve it.
+    The counter goes before the last 'suffix_len' characters, i.e. the
+    suffix that matched the config, so 'x.tar.gz' becomes 'x (1).tar.gz'.
+    """
+    candidate = name
+    if candidate.lower() in taken:
+        split = len(name) - suffix_len
+        stem, suffix = name[:split], name[split:]
+        counter = 1
+        while True:
+            candidate = f"{stem} ({counter}){suffix}"
+            if candidate.lower() not in taken:
+                break
+            counter += 1
+
+    taken.add(candidate.lower())
+    return candidate
+
+
+def _listdir_names(directory: str) -> Set[str]:
+    try:
+        return {name.lower() for name in os.listdir(directory)}
+    except FileNotFoundError:
+        return set()
+
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    _MOVEFILE_COPY_ALLOWED = 0x2
+    _MOVEFILE_WRITE_THROUGH = 0x8
+
+    _MoveFileExW = ctypes.WinDLL("kernel32", use_last_error=True).MoveFileExW
+    _MoveFileExW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD)
+    _MoveFileExW.restype = wintypes.BOOL
+
+    def _fast_move(src: str, dest: str) -> None:
+        """
+        Cross-volume move in a single MoveFileExW call; Windows copies the
+        data itself instead of shutil's userspace read/write loop.
+        """
+        if not _MoveFileExW(src, dest, _MOVEFILE_COPY_ALLOWED | _MOVEFILE_WRITE_THROUGH):
+            raise ctypes.WinError(ctypes.get_last_error())
+else:
+    # shutil.move's copy already goes through os.sendfile on Linux and
+    # fcopyfile on macOS, so there is nothing faster to call here.
+    _fast_move = shutil.move
+
+
+def _move(src: str, dest: str) -> None:
+    """
+    Move a file with a plain rename, falling back to _fast_move only when
+    src and dest are on different devices. Callers guarantee dest is free.
+    """
+    try:
+        os.rename(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        _fast_move(src, dest)
+
+
+def _plan_moves(
+    root: str,
+    config: OrganizerConfig,
+    recursive: bool,
+    manifest: Optional[Dict[str, list]] = None,
+    prefetch: bool = False,
+) -> Tuple[Dict[str, List[Tuple[str, str, int]]], int, int]:
+    """
+    Scan 'root' and return (plan, skipped_unmapped, skipped_other), where
+    plan maps each category to the (path, name, suffix_len) of every file
+    that has to move there, so the moves can later be applied one folder at
+    a time. suffix_len is the length of the config suffix that matched.
+    Nothing is modified here.
+
+    If a manifest from an earlier scan is given, folders it shows as
+    unchanged are skipped and their counts reused; the manifest is then
+    rewritten in place to describe this scan.
+    With prefetch, folders are listed ahead on a background thread.
+    """
+    plan: Dict[str, List[Tuple[str, str, int]]] = {c: [] for c in config.extension_index.values()}
+    planned = 0
+    skipped_unmapped = 0
+    skipped_other = 0
+    get_category = config.extension_index.get
+    classify = config.classify_suffix
+    multi_dot = config.has_multi_dot_suffixes
+    ignore_hidden_files = config.ignore_hidden_files
+    # Category folder path -> category, to tell files that are already in place.
+    # normcase so 'images' on disk matches 'Images' on case-insensitive Windows.
+    category_dirs = {
+        os.path.normcase(os.path.join(root, c)): c
+        for c in config.extension_index.values()
+    }
+
+    previous: Optional[Dict[str, list]] = None
+    settled_before = 0
+    if manifest is not None:
+        previous = dict(manifest)
+        manifest.clear()
+        # A folder changed in the last moments may change again without a new mtime
+        settled_before = time.time_ns() - 2_000_000_000
+
+    walk = _iter_dirs(root, recursive, config.ignore_hidden_folders, previous)
+    if prefetch:
+        walk = _prefetch(walk)
+
+    current_parent: Optional[str] = None
+    for parent, mtime_ns, files, subdirs, unreadable in walk:
+        if files is None:
+            cached = previous[parent]
+            skipped_unmapped += cached[1]
+            skipped_other += cached[2]
+            manifest[parent] = cached
+            continue
+
+        if parent == root:
+            files = [f for f in files if f[0] != MANIFEST_NAME]
+
+        # Pages of one folder arrive back to back; reset per-folder state on the first
+        if parent != current_parent:
+            current_parent = parent
+            planned_before = planned
+            unmapped_before = skipped_unmapped
+            other_before = skipped_other
+            unreadable_in_folder = 0
+            own_category = category_dirs.get(os.path.normcase(parent))
+
+        skipped_other += unreadable
+        unreadable_in_folder += unreadable
+
+        for name, path in files:
+            # Hidden file?
+            if ignore_hidden_files and _is_hidden(name):
+                skipped_other += 1
+                continue
+
+            head, _, tail = name.rpartition(".")
+            if multi_dot and "." in head:
+                category, suffix_len = classify(name)
+            else:
+                category = get_category("." + tail.lower()) if head else None
+                suffix_len = len(tail) + 1
+
+            if not category:
+                skipped_unmapped += 1
+                continue
+
+            # Already in correct folder
+            if category == own_category:
+                continue
+
+            plan[category].append((path, name, suffix_len))
+            planned += 1
+
+        if subdirs is None:
+            continue  # more pages of this folder follow
+
+        # Only folders with nothing left to move can be skipped next time. Folders with
+        # unreadable links are re-listed, as fixing a link target leaves their mtime alone.
+        if (
+            manifest is not None
+            and planned == planned_before
+            and not unreadable_in_folder
+            and mtime_ns < settled_before
+        ):
+            manifest[parent] = [
+                mtime_ns,
+                skipped_unmapped - unmapped_before,
+                skipped_other - other_before,
+                subdirs,
+            ]
+
+    return plan, skipped_unmapped, skipped_other
+
+
+def _try_move(src: str, dest: str) -> Optional[Exception]:
+    try:
+        _move(src, dest)
+    except Exception as exc:
+        return exc
+    return None
+
+
+def _execute_moves(
+    moves: List[Tuple[str, str, str]],
+    max_workers: int,
+) -> Iterator[Tuple[str, str, str, Optional[Exception]]]:
+    """
+    Perform planned (src, dest, category) moves and yield each one back
+    together with the exception it raised, or None.
+    With max_workers > 1 the moves run on a thread pool (0 = pick automatically);
+    results are always consumed on the caller's thread.
+    """
+    if max_workers <= 0:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    if max_workers == 1 or len(moves) < 2:
+        for src, dest, category in moves:
+            yield src, dest, category, _try_move(src, dest)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(_try_move, src, dest): (src, dest, category)
+            for src, dest, category in moves
+        }
+        try:
+            for future in as_completed(futures):
+                src, dest, category = futures[future]
+                yield src, dest, category, future.result()
+        except BaseException:
+            # Ctrl+C or an abandoned generator: drop the moves not yet started
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
 # ---------- Main logic ----------
 
 def organize_folder(
@@ -78,67 +531,92 @@ def organize_folder(
     recursive: bool = True,
     dry_run: bool = False,
     verbose: bool = True,
+    max_workers: int = 1,
+    use_cache: bool = False,
+    prefetch: bool = False,
 ) -> OrganizeResult:
-    if not folder.exists() or not folder.is_dir():
+    """
+    With use_cache, a manifest (MANIFEST_NAME) is kept in 'folder' so that
+    later runs skip subfolders that have not changed since. Meant for
+    repeated runs; ignored in dry-run mode.
+    With prefetch, directory listing runs on a background thread, which
+    helps on network or cloud-mounted folders.
+    """
+    if not folder.is_dir():
         raise ValueError(f"Folder does not exist or is not a directory: {folder}")
 
-    moved_counter: Counter = Counter()
-    skipped_unmapped = 0
-    skipped_other = 0
+    # Plain dict in config order; converted to a Counter for the result
+    moved_counts: Dict[str, int] = dict.fromkeys(config.extension_index.values(), 0)
 
     if verbose:
         print(f"\nOrganizing folder: {folder}")
         print(f"Recursive: {recursive} | Dry-run: {dry_run}")
         print("-" * 60)
 
-    iterator = folder.rglob("*") if recursive else folder.iterdir()
-
-    for item in iterator:
-        try:
-            # Skip directories
-            if item.is_dir():
-                if config.ignore_hidden_folders and _is_hidden(item):
-                    continue
-                continue
-
-            # Hidden file?
-            if config.ignore_hidden_files and _is_hidden(item):
-                skipped_other += 1
-                continue
+    folder_str = str(folder)
+    # Length of 'folder' plus separator, to log paths relative to it by slicing
+    prefix_len = len(os.path.join(folder_str, ""))
+    log_buf: List[str] = []
 
-            ext = item.suffix.lower()
-            category = config.extension_index.get(ext)
+    manifest: Optional[Dict[str, list]] = None
+    if use_cache and not dry_run:
+        fingerprint = _manifest_fingerprint(config, recursive)
+        manifest = _load_manifest(folder_str, fingerprint)
 
-            if not category:
-                skipped_unmapped += 1
-                continue
+    # Phase 1: scan the tree without touching it
+    plan, skipped_unmapped, skipped_other = _plan_moves(
+        folder_str, config, recursive, manifest, prefetch
+    )
 
-            target_dir = folder / category
+    # Phase 2: per category, create the folder, pick free names and apply the moves
+    moves: List[Tuple[str, str, str]] = []
 
-            # Already in correct folder
-            if item.parent == target_dir:
-                continue
+    for category, items in plan.items():
+        if not items:
+            continue
 
+        # Built from folder_str so it shares the prefix sliced off for logging
+        target_dir = os.path.join(folder_str, category)
+        try:
             if not dry_run:
-                target_dir.mkdir(parents=True, exist_ok=True)
+                os.makedirs(target_dir, exist_ok=True)
+            # Names already present or reserved in the folder
+            names = _listdir_names(target_dir)
+        except Exception as exc:  # Safety net
+            skipped_other += len(items)
+            if verbose:
+                for path, _, _ in items:
+                    _log(log_buf, f"Skipping '{path}': {exc}")
+            continue
 
-            dest = target_dir / item.name
-            dest = generate_unique_path(dest)
+        # Nothing below can fail; errors only come from the moves themselves
+        for path, name, suffix_len in items:
+            dest = os.path.join(target_dir, _unique_name(name, names, suffix_len))
 
             if dry_run:
                 if verbose:
-                    print(f"[DRY-RUN] {item.relative_to(folder)} -> {dest.relative_to(folder)}")
+                    _log(log_buf, f"[DRY-RUN] {path[prefix_len:]} -> {dest[prefix_len:]}")
+                moved_counts[category] += 1
             else:
-                shutil.move(str(item), str(dest))
-                if verbose:
-                    print(f"Moved: {item.relative_to(folder)} -> {dest.relative_to(folder)}")
-
-            moved_counter[category] += 1
+                moves.append((path, dest, category))
 
-        except Exception as exc:  # Safety net
+    for src, dest, category, exc in _execute_moves(moves, max_workers):
+        if exc is not None:
             skipped_other += 1
             if verbose:
-                print(f"Skipping '{item}': {exc}")
+                _log(log_buf, f"Skipping '{src}': {exc}")
+            continue
+
+        if verbose:
+            _log(log_buf, f"Moved: {src[prefix_len:]} -> {dest[prefix_len:]}")
+        moved_counts[category] += 1
+
+    _flush_log(log_buf)
+
+    if manifest is not None:
+        _save_manifest(folder_str, fingerprint, manifest)
+
+    moved_counter = Counter({cat: n for cat, n in moved_counts.items() if n})
 
     if verbose:
         print("\nSummary")
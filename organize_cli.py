@@ -35,7 +35,21 @@ def parse_args():
         default=0,
         help="Run repeatedly every N minutes (0 = run once).",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of threads used to move files (default: 1, 0 = auto).",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="List folders ahead on a background thread (useful on network drives).",
+    )
+    args = parser.parse_args()
+    if args.workers < 0:
+        parser.error("--workers must be a non-negative integer.")
+    return args
 
 
 def main():
@@ -49,10 +63,15 @@ def main():
     recursive = not args.no_recursive
     dry_run = args.dry_run
     interval_min = args.interval
+    max_workers = args.workers
+    prefetch = args.prefetch
 
     if interval_min <= 0:
         # Single run
-        organize_folder(folder, config, recursive=recursive, dry_run=dry_run, verbose=True)
+        organize_folder(
+            folder, config, recursive=recursive, dry_run=dry_run, verbose=True,
+            max_workers=max_workers, prefetch=prefetch,
+        )
     else:
         # Repeated runs
         interval_sec = interval_min * 60
@@ -62,7 +81,16 @@ def main():
         try:
             while True:
                 print("\n=== Run started ===")
-                organize_folder(folder, config, recursive=recursive, dry_run=dry_run, verbose=True)
+                # Cheap when the file is unchanged: from_json caches by mtime.
+                # A missing or half-written file keeps the previous config.
+                try:
+                    config = OrganizerConfig.from_json(config_path)
+                except (OSError, ValueError) as exc:
+                    print(f"Could not reload config, keeping the previous one: {exc}")
+                organize_folder(
+                    folder, config, recursive=recursive, dry_run=dry_run, verbose=True,
+                    max_workers=max_workers, use_cache=True, prefetch=prefetch,
+                )
                 print(f"Sleeping for {interval_min} minute(s)...")
                 time.sleep(interval_sec)
         except KeyboardInterrupt:
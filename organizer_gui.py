@@ -1,6 +1,6 @@
 from __future__ import annotations
 import threading
-import time
+from collections import deque
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -19,11 +19,14 @@ class OrganizerGUI(tk.Tk):
         self.recursive_var = tk.BooleanVar(value=True)
         self.dry_run_var = tk.BooleanVar(value=False)
         self.interval_var = tk.StringVar(value="0")  # minutes
+        self.workers_var = tk.StringVar(value="1")
 
-        self._auto_running = False
+        self._stop_event: threading.Event | None = None
         self._auto_thread: threading.Thread | None = None
+        self._log_queue: deque[str] = deque()
 
         self._build_widgets()
+        self.after(100, self._drain_log)
 
     # ---------- UI ----------
 
@@ -71,6 +74,13 @@ class OrganizerGUI(tk.Tk):
             row=1, column=1, sticky="w", **padding
         )
 
+        ttk.Label(frm_opts, text="Worker threads (0 = auto):").grid(
+            row=2, column=0, sticky="w", **padding
+        )
+        ttk.Entry(frm_opts, textvariable=self.workers_var, width=8).grid(
+            row=2, column=1, sticky="w", **padding
+        )
+
         # Buttons
         frm_btns = ttk.Frame(self)
         frm_btns.pack(fill="x", padx=8, pady=4)
@@ -97,8 +107,17 @@ class OrganizerGUI(tk.Tk):
     # ---------- Helpers ----------
 
     def log(self, msg: str):
-        self.txt_log.insert("end", msg + "\n")
-        self.txt_log.see("end")
+        # Safe to call from worker threads; the Text widget is updated by _drain_log
+        self._log_queue.append(msg)
+
+    def _drain_log(self):
+        if self._log_queue:
+            lines = []
+            while self._log_queue:
+                lines.append(self._log_queue.popleft())
+            self.txt_log.insert("end", "\n".join(lines) + "\n")
+            self.txt_log.see("end")
+        self.after(100, self._drain_log)
 
     def browse_folder(self):
         folder = filedialog.askdirectory(title="Select folder to organize")
@@ -133,25 +152,33 @@ class OrganizerGUI(tk.Tk):
         except ValueError:
             raise ValueError("Interval must be a non-negative integer.")
 
+        workers_str = self.workers_var.get().strip() or "1"
+        try:
+            max_workers = int(workers_str)
+            if max_workers < 0:
+                raise ValueError
+        except ValueError:
+            raise ValueError("Worker threads must be a non-negative integer.")
+
         config = OrganizerConfig.from_json(config_path)
-        return folder, config, recursive, dry_run, interval_min
+        return folder, config, recursive, dry_run, interval_min, max_workers
 
     # ---------- Actions ----------
 
     def run_once(self):
         try:
-            folder, config, recursive, dry_run, _ = self._load_settings()
+            folder, config, recursive, dry_run, _, max_workers = self._load_settings()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             return
 
         self.status_var.set("Running...")
         self.log(f"\n=== Run started on {folder} ===")
-        self.update_idletasks()
 
         def worker():
             result: OrganizeResult = organize_folder(
-                folder, config, recursive=recursive, dry_run=dry_run, verbose=False
+                folder, config, recursive=recursive, dry_run=dry_run, verbose=False,
+                max_workers=max_workers,
             )
             summary_lines = [
                 "Summary:",
@@ -159,24 +186,23 @@ class OrganizerGUI(tk.Tk):
                 f"  Unmapped: {result.skipped_unmapped}",
                 f"  Other skipped: {result.skipped_other}",
             ]
-            self.after(0, lambda: self._finish_run(summary_lines))
+            self.log("\n".join(summary_lines))
+            self.after(0, self._finish_run)
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def _finish_run(self, summary_lines):
-        for line in summary_lines:
-            self.log(line)
+    def _finish_run(self):
         self.status_var.set("Done.")
 
     def toggle_auto_run(self):
-        if self._auto_running:
-            self._auto_running = False
+        if self._stop_event is not None and not self._stop_event.is_set():
+            self._stop_event.set()
             self.btn_auto.configure(text="Start auto-run")
             self.status_var.set("Auto-run stopped.")
             return
 
         try:
-            folder, config, recursive, dry_run, interval_min = self._load_settings()
+            folder, config, recursive, dry_run, interval_min, max_workers = self._load_settings()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             return
@@ -185,17 +211,25 @@ class OrganizerGUI(tk.Tk):
             messagebox.showinfo("Info", "Set interval > 0 to enable auto-run.")
             return
 
-        self._auto_running = True
+        if self._auto_thread is not None and self._auto_thread.is_alive():
+            messagebox.showinfo(
+                "Info", "The previous auto-run cycle is still finishing. Try again shortly."
+            )
+            return
+
+        # A fresh event per start, so each worker only ever sees its own stop
+        stop_event = self._stop_event = threading.Event()
         self.btn_auto.configure(text="Stop auto-run")
         self.status_var.set(f"Auto-run every {interval_min} minute(s).")
 
         def auto_worker():
             interval_sec = interval_min * 60
-            while self._auto_running:
+            while not stop_event.is_set():
                 self.log("\n=== Auto-run cycle started ===")
                 try:
                     result: OrganizeResult = organize_folder(
-                        folder, config, recursive=recursive, dry_run=dry_run, verbose=False
+                        folder, config, recursive=recursive, dry_run=dry_run, verbose=False,
+                        max_workers=max_workers, use_cache=True,
                     )
                     summary_lines = [
                         "Summary:",
@@ -203,16 +237,16 @@ class OrganizerGUI(tk.Tk):
                         f"  Unmapped: {result.skipped_unmapped}",
                         f"  Other skipped: {result.skipped_other}",
                     ]
-                    self.after(0, lambda sl=summary_lines: [self.log(line) for line in sl])
+                    self.log("\n".join(summary_lines))
                 except Exception as exc:
-                    self.after(0, lambda e=exc: self.log(f"Error: {e}"))
+                    self.log(f"Error: {exc}")
 
-                for _ in range(interval_sec):
-                    if not self._auto_running:
-                        break
-                    time.sleep(1)
+                if stop_event.wait(interval_sec):
+                    break
 
-            self.after(0, lambda: self.status_var.set("Auto-run stopped."))
+            # Don't overwrite the status of an auto-run started after this one
+            if self._stop_event is stop_event:
+                self.after(0, lambda: self.status_var.set("Auto-run stopped."))
 
         self._auto_thread = threading.Thread(target=auto_worker, daemon=True)
         self._auto_thread.start()